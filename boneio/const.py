@@ -117,6 +117,7 @@ MCP_ID = "mcp_id"
 PCA_ID = "pca_id"
 PCF_ID = "pcf_id"
 INIT_SLEEP = "init_sleep"
+INTERRUPT_PIN = "interrupt_pin"
 OUTPUT_GROUP = "output_group"
 
 # SENSOR CONST
@@ -7,7 +7,7 @@ from typing import List
 
 from boneio.const import COVER, OFF, ON, SWITCH
 from boneio.models import OutputState
-from boneio.relay.basic import BasicRelay
+from boneio.relay.basic import STATE_PAYLOADS, BasicRelay
 
 
 class OutputGroup(BasicRelay):
@@ -60,7 +60,7 @@ class OutputGroup(BasicRelay):
             )
         if state != self._state or not event:
             self._state = state
-            self._loop.create_task(self.async_send_state())
+            self.send_state()
 
     async def async_turn_on(self) -> None:
         """Call turn on action."""
@@ -78,7 +78,11 @@ class OutputGroup(BasicRelay):
         return self._state == ON
 
     async def async_send_state(self) -> None:
+        """Send state to Mqtt on action asynchronously."""
+        self.send_state()
+
+    def send_state(self) -> None:
         """Send state to Mqtt on action."""
         self._message_bus.send_message(
-            topic=self._send_topic, payload=self.payload(), retain=True
+            topic=self._send_topic, payload=STATE_PAYLOADS[self._state], retain=True
         )
@@ -20,17 +20,20 @@ class AsyncUpdater:
 
 
     async def _refresh(self) -> None:
+        # Resolved once; neither changes while the loop runs.
+        default_interval = self._update_interval.total_in_seconds
+        async_update = getattr(self, "async_update", None)
         try:
             while True:
-                if hasattr(self, "async_update"):
+                if async_update is not None:
                     update_interval = (
-                        await self.async_update(timestamp=time.time())
-                        or self._update_interval.total_in_seconds
+                        await async_update(timestamp=time.time())
+                        or default_interval
                     )
                 else:
                     update_interval = (
-                    self.update(timestamp=time.time()) or self._update_interval.total_in_seconds
-                )
+                        self.update(timestamp=time.time()) or default_interval
+                    )
                 await asyncio.sleep(update_interval)
         except asyncio.CancelledError:
             raise
@@ -166,6 +166,15 @@ class EventBus:
         """
         self._event_queue.put_nowait(event)
 
+    def trigger_events(self, events):
+        """
+        Put several events from one update cycle into the queue.
+        :param events: iterable of events accepted by trigger_event
+        """
+        put_nowait = self._event_queue.put_nowait
+        for event in events:
+            put_nowait(event)
+
     def request_stop(self):
         """Request the event bus to stop."""
         if self._worker_task and not self._shutting_down:
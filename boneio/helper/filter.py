@@ -19,21 +19,35 @@ FILTERS = {
 }
 
 
+def compile_filters(filters: list) -> tuple:
+    """Resolve a filter config list into (function, argument) steps."""
+    steps = []
+    for filter in filters:
+        for k, v in filter.items():
+            if k not in FILTERS:
+                _LOGGER.warning("Filter %s doesn't exists. Fix it in config.", k)
+                continue
+            steps.append((FILTERS[k], v))
+    return tuple(steps)
+
+
 class Filter:
     _filters = []
+    _compiled_filters = ()
+
+    def set_filters(self, filters: list) -> None:
+        """Store ``filters`` and compile them once for _apply_filters."""
+        self._filters = filters
+        self._compiled_filters = compile_filters(filters)
 
     def _apply_filters(
         self, value: float | None, filters: Optional[list] = None
     ) -> float | None:
-        filters = filters if filters is not None else self._filters
-        for filter in filters:
-            for k, v in filter.items():
-                if k not in FILTERS:
-                    _LOGGER.warning(
-                        "Filter %s doesn't exists. Fix it in config.", k
-                    )
-                    continue
-                if value is None:
-                    return None
-                value = FILTERS[k](value, v)
+        steps = (
+            self._compiled_filters if filters is None else compile_filters(filters)
+        )
+        for func, arg in steps:
+            if value is None:
+                return None
+            value = func(value, arg)
         return value
@@ -86,11 +86,19 @@ class GpioManager:
         callback: Callable[[], None],
         edge: Literal[FALLING, RISING, BOTH] = BOTH,
         debounce_period: timedelta = timedelta(milliseconds=100),
+        on_armed: Callable[[], None] | None = None,
     ) -> None:
-        """Add detection for RISING, FALLING and BOTH events."""
+        """Add detection for RISING, FALLING and BOTH events.
+
+        ``on_armed`` is called once edges on the line are being detected.
+        """
         asyncio.create_task(
             self._add_event_callback(
-                pin=pin, edge=edge, callback=callback, debounce_period=debounce_period
+                pin=pin,
+                edge=edge,
+                callback=callback,
+                debounce_period=debounce_period,
+                on_armed=on_armed,
             )
         )
 
@@ -100,6 +108,7 @@ class GpioManager:
         edge: Literal[FALLING, RISING, BOTH],
         callback: Callable[[], None],
         debounce_period: timedelta,
+        on_armed: Callable[[], None] | None = None,
     ) -> None:
         gpiod_edge = {
             FALLING: gpiod.line.Edge.FALLING,
@@ -126,6 +135,8 @@ class GpioManager:
                 fut.set_result(events)
 
             self._loop.add_reader(request.fd, on_change)
+            if on_armed is not None:
+                on_armed()
 
             while True:
                 await fut
@@ -3,9 +3,9 @@ from __future__ import annotations
 import logging
 import time
 from collections import namedtuple
+from datetime import timedelta
 from typing import TYPE_CHECKING, Any, Callable, Dict, Union
 
-from adafruit_mcp230xx.mcp23017 import MCP23017
 from adafruit_pca9685 import PCA9685
 
 from boneio.const import (
@@ -14,12 +14,14 @@ from boneio.const import (
     COVER,
     DEVICE_CLASS,
     EVENT_ENTITY,
+    FALLING,
     FILTERS,
     GPIO,
     ID,
     INIT_SLEEP,
     INPUT,
     INPUT_SENSOR,
+    INTERRUPT_PIN,
     KIND,
     LM75,
     MCP,
@@ -63,6 +65,7 @@ from boneio.helper.ha_discovery import (
     ha_sensor_availabilty_message,
     ha_virtual_energy_sensor_discovery_message,
 )
+from boneio.helper.mcp23017 import MCP23017
 from boneio.helper.onewire import (
     DS2482,
     DS2482_ADDRESS,
@@ -202,6 +205,7 @@ def create_expander(
     expander_config: list,
     exp_type: ExpanderTypes,
     i2cbusio: I2C,
+    gpio_manager: GpioManager | None = None,
 ) -> dict:
     grouped_outputs = {}
     for expander in expander_config:
@@ -218,6 +222,20 @@ def create_expander(
                 time.sleep(sleep_time.total_seconds)
             else:
                 _LOGGER.debug(f"{exp_type} {id} is initializing.")
+            interrupt_pin = expander.get(INTERRUPT_PIN)
+            if interrupt_pin and gpio_manager:
+                _LOGGER.debug(
+                    "Refreshing %s %s on interrupt from %s.", exp_type, id, interrupt_pin
+                )
+                # Switch to interrupt mode only once the line is watched, so
+                # the initial port read clears INT with nothing missed.
+                gpio_manager.add_event_callback(
+                    pin=interrupt_pin,
+                    callback=expander_dict[id].refresh,
+                    edge=FALLING,
+                    debounce_period=timedelta(0),
+                    on_armed=expander_dict[id].use_interrupt,
+                )
             grouped_outputs[id] = {}
         except TimeoutError as err:
             _LOGGER.error("Can't connect to %s %s. %s", exp_type, id, err)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from adafruit_mcp230xx.mcp23017 import MCP23017 as AdafruitMCP23017
+
+try:
+    from busio import I2C
+except ImportError:
+    pass
+
+_MCP23017_GPIOA = 0x12
+# IOCON.MIRROR: INTA and INTB are OR'ed, so one host line covers both ports.
+_IOCON_MIRROR = 0x40
+# Reads within this window are served from the last 16-bit GPIOA/B word.
+GPIO_CACHE_TTL = 0.01
+
+
+class MCP23017(AdafruitMCP23017):
+    """MCP23017 serving port reads from one cached 16-bit word.
+
+    Every DigitalInOut.value read and write goes through ``gpio``, so all
+    relays on the same chip share one I2C read instead of one each.
+    Writes update the cache (write-through). Relay changes made on the
+    event loop are staged with ``write_bits`` and go out as one port write
+    per loop iteration; changes from other threads (cover movement) are
+    written at once. The port word and staged bits are guarded by a lock.
+    """
+
+    def __init__(self, i2c: I2C, address: int, reset: bool = True) -> None:
+        self._gpio_cache: int | None = None
+        self._gpio_cache_ts = 0.0
+        self._gpio_cache_ttl: float | None = GPIO_CACHE_TTL
+        self._pending_mask = 0
+        self._pending_value = 0
+        self._flush_handle: asyncio.Handle | None = None
+        self._loop = asyncio.get_event_loop()
+        self._loop_thread_id = threading.get_ident()
+        # Reentrant: write_bits and flush go through the gpio property.
+        self._lock = threading.RLock()
+        super().__init__(i2c, address=address, reset=reset)
+
+    def use_interrupt(self) -> None:
+        """Raise INT on any input change and keep the cached port word until then.
+
+        INT stays the default active-low push-pull output. Pins used as
+        outputs never raise it, so interrupt-on-change is enabled on all 16.
+        Call only once the host line is watched: until then reads keep
+        going to the bus every ``GPIO_CACHE_TTL``.
+        """
+        # INTCON 0: compare against the previous pin value, not DEFVAL.
+        self.interrupt_configuration = 0x0000
+        self.io_control = self.io_control | _IOCON_MIRROR
+        self.interrupt_enable = 0xFFFF
+        # The line is already watched, so this read both syncs the cache and
+        # releases INT; any later change raises a new falling edge.
+        self.refresh()
+        self._gpio_cache_ttl = None
+
+    def refresh(self) -> None:
+        """Re-read the port in one transaction. Called on INT edge.
+
+        Reading GPIO also clears the interrupt, so INT can fire again.
+        """
+        with self._lock:
+            self._gpio_cache = self._read_u16le(_MCP23017_GPIOA)
+            self._gpio_cache_ts = time.monotonic()
+
+    @property
+    def gpio(self) -> int:
+        with self._lock:
+            if self._gpio_cache is None:
+                self.refresh()
+            elif (
+                self._gpio_cache_ttl is not None
+                and time.monotonic() - self._gpio_cache_ts > self._gpio_cache_ttl
+            ):
+                self.refresh()
+            if self._pending_mask:
+                return (self._gpio_cache & ~self._pending_mask) | self._pending_value
+            return self._gpio_cache
+
+    @gpio.setter
+    def gpio(self, val: int) -> None:
+        with self._lock:
+            self._write_u16le(_MCP23017_GPIOA, val)
+            self._gpio_cache = val
+            self._gpio_cache_ts = time.monotonic()
+            self._pending_mask = 0
+            self._pending_value = 0
+
+    def write_bits(self, mask: int, value: int) -> None:
+        """Set pins in ``mask`` to ``value``.
+
+        On the event loop the change is staged and flushed once per loop
+        iteration. From any other thread it is written immediately, along
+        with anything already staged: call_soon from there would not wake
+        the loop, leaving e.g. a cover motor relay on past its stop time.
+        """
+        with self._lock:
+            self._pending_mask |= mask
+            self._pending_value = (self._pending_value & ~mask) | (value & mask)
+            if threading.get_ident() != self._loop_thread_id:
+                self.gpio = self.gpio
+            elif self._flush_handle is None:
+                self._flush_handle = self._loop.call_soon(self.flush)
+
+    def flush(self) -> None:
+        """Write all staged pin changes in one I2C transaction."""
+        with self._lock:
+            self._flush_handle = None
+            if self._pending_mask:
+                self.gpio = self.gpio
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sys
+
 from boneio.helper.util import strip_accents
 from boneio.message_bus.basic import MessageBus
 
@@ -9,6 +11,8 @@ from boneio.message_bus.basic import MessageBus
 class BasicMqtt:
     """Basic MQTT class."""
 
+    __slots__ = ("_id", "_name", "_message_bus", "_send_topic")
+
     def __init__(
         self,
         id: str,
@@ -23,7 +27,8 @@ class BasicMqtt:
         self._name = name
         self._message_bus = message_bus
         topic_id = strip_accents(self.id)
-        self._send_topic = f"{topic_prefix}/{topic_type}/{topic_id}"
+        # Interned so queue/dict lookups keyed by topic hit the identity check.
+        self._send_topic = sys.intern(f"{topic_prefix}/{topic_type}/{topic_id}")
 
     @property
     def id(self) -> str:
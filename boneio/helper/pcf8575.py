@@ -8,6 +8,32 @@ except ImportError:
 
 
 class PCF8575(AdafruitPCF8575):
+    """PCF8575 which can serve port reads from the last written/read word.
+
+    Without an interrupt line every read goes to the bus as before. With
+    ``use_interrupt`` the word is only re-read when the INT line fires.
+    """
 
     def __init__(self, i2c: I2C, address: int, reset: bool) -> None:
         super().__init__(i2c_bus=i2c, address=address)
+        self._gpio_cache: int | None = None
+        self._use_interrupt = False
+
+    def use_interrupt(self) -> None:
+        """Keep the cached port word until the INT line reports a change."""
+        self._use_interrupt = True
+
+    def refresh(self) -> None:
+        """Re-read the port in one transaction. Called on INT edge."""
+        self._gpio_cache = super().read_gpio()
+
+    def read_gpio(self) -> int:
+        if not self._use_interrupt or self._gpio_cache is None:
+            self.refresh()
+        return self._gpio_cache
+
+    def write_gpio(self, val: int) -> None:
+        super().write_gpio(val)
+        # Pins used as inputs are written high; a following interrupt
+        # corrects their level if something pulls them low.
+        self._gpio_cache = val & 0xFFFF
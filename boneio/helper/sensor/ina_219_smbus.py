@@ -1,5 +1,8 @@
 # Based on https://github.com/AlexandreFrolov/ina219/blob/main/ina_219_smbus.py
 from __future__ import annotations
+
+from typing import Collection
+
 import smbus2
 
 
@@ -154,6 +157,22 @@ class INA219_I2C:
         CV = self.get_current(mA=False)
         return round((BV * CV) * (1000 if mW is True else 1), 2)
 
+    def read_all(self, device_classes: Collection[str]) -> dict[str, float]:
+        """
+        Read the requested values among current, power and voltage.
+        Each register is read at most once; power is derived from the bus
+        voltage and current as in get_power instead of re-reading them.
+        """
+        values = {}
+        with_power = "power" in device_classes
+        if with_power or "voltage" in device_classes:
+            values["voltage"] = self.get_bus_voltage()
+        if with_power or "current" in device_classes:
+            values["current"] = self.get_current(mA=False)
+        if with_power:
+            values["power"] = round(values["voltage"] * values["current"], 2)
+        return values
+
     def read_word(self, address):
         read_data = self.bus.read_word_data(self._address, address)
         ac_high_byte = read_data & 0xFF
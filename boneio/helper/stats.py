@@ -7,7 +7,7 @@ import time
 from math import floor
 
 # Typing imports that create a circular dependency
-from typing import TYPE_CHECKING, Callable, List
+from typing import TYPE_CHECKING, Any, Callable, List
 
 import psutil
 
@@ -58,11 +58,58 @@ def display_time(seconds):
     return "".join(result)
 
 
+class HostSnapshot:
+    """Shared cache of psutil samples.
+
+    Every host screen, serial number sensor and web url lookup reads psutil
+    through this object, so samples taken within max_age seconds are reused
+    instead of hitting psutil again for each consumer.
+    """
+
+    def __init__(self, max_age: float = 5) -> None:
+        """Initialize snapshot."""
+        self._max_age = max_age
+        self._samples: dict[str, tuple[float, Any]] = {}
+
+    def _sample(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """Return cached sample or fetch a new one if it is too old."""
+        now = time.monotonic()
+        cached = self._samples.get(key)
+        if cached is not None and now - cached[0] < self._max_age:
+            return cached[1]
+        value = fetch()
+        self._samples[key] = (now, value)
+        return value
+
+    @property
+    def net(self) -> dict:
+        return self._sample(NETWORK, psutil.net_if_addrs)
+
+    @property
+    def cpu(self):
+        return self._sample(CPU, psutil.cpu_times_percent)
+
+    @property
+    def disk(self):
+        return self._sample(DISK, lambda: psutil.disk_usage("/"))
+
+    @property
+    def vm(self):
+        return self._sample(MEMORY, psutil.virtual_memory)
+
+    @property
+    def swap(self):
+        return self._sample(SWAP, psutil.swap_memory)
+
+
+host_snapshot = HostSnapshot()
+
+
 def get_network_info():
     """Fetch network info."""
 
     def retrieve_from_psutil():
-        addrs = psutil.net_if_addrs()["eth0"]
+        addrs = host_snapshot.net["eth0"]
         out = {IP: NONE, MASK: NONE, MAC: NONE}
         for addr in addrs:
             if addr.family == socket.AF_INET:
@@ -77,7 +124,7 @@ def get_network_info():
 
 def get_cpu_info():
     """Fetch CPU info."""
-    cpu = psutil.cpu_times_percent()
+    cpu = host_snapshot.cpu
     return {
         "total": f"{int(100 - cpu.idle)}%",
         "user": f"{cpu.user}%",
@@ -87,7 +134,7 @@ def get_cpu_info():
 
 def get_disk_info():
     """Fetch disk info."""
-    disk = psutil.disk_usage("/")
+    disk = host_snapshot.disk
     return {
         "total": f"{floor(disk.total / GIGABYTE)}GB",
         "used": f"{floor(disk.used / GIGABYTE)}GB",
@@ -97,7 +144,7 @@ def get_disk_info():
 
 def get_memory_info():
     """Fetch memory info."""
-    vm = psutil.virtual_memory()
+    vm = host_snapshot.vm
     return {
         "total": f"{floor(vm.total / MEGABYTE)}MB",
         "used": f"{floor(vm.used / MEGABYTE)}MB",
@@ -107,7 +154,7 @@ def get_memory_info():
 
 def get_swap_info():
     """Fetch swap info."""
-    swap = psutil.swap_memory()
+    swap = host_snapshot.swap
     return {
         "total": f"{floor(swap.total / MEGABYTE)}MB",
         "used": f"{floor(swap.used / MEGABYTE)}MB",
@@ -134,7 +181,7 @@ class HostSensor(AsyncUpdater):
     ) -> None:
         self._update_function = update_function
         self._static_data = static_data
-        self._state = {}
+        self._state = dict(static_data) if static_data else {}
         self._type = type
         self._event_bus = event_bus
         self._loop = asyncio.get_event_loop()
@@ -143,7 +190,10 @@ class HostSensor(AsyncUpdater):
         self._loop.create_task(self.async_update(time.time()))
 
     async def async_update(self, timestamp: float) -> None:
-        self._state = self._update_function()
+        if self._static_data:
+            self._state = {**self._static_data, **self._update_function()}
+        else:
+            self._state = self._update_function()
         sensor_state = HostSensorState(
             id=self.id,
             name=self._type,
@@ -158,8 +208,7 @@ class HostSensor(AsyncUpdater):
 
     @property
     def state(self) -> dict:
-        if self._static_data:
-            return {**self._static_data, **self._state}
+        """Return state merged with static data on update."""
         return self._state
 
 
@@ -261,37 +310,15 @@ class HostData:
                 "update_interval": TimePeriod(seconds=60),
             }
         if extra_sensors:
+            resolved_extra_sensors = self._resolve_extra_sensors(
+                manager=manager, extra_sensors=extra_sensors
+            )
 
             def get_extra_sensors_values():
-                output = {}
-                for sensor in extra_sensors[:3]:
-                    sensor_type = sensor.get("sensor_type")
-                    sensor_id = sensor.get("sensor_id")
-                    if sensor_type == "modbus":
-                        modbus_id = sensor.get("modbus_id")
-                        _modbus_coordinator = manager.modbus_coordinators.get(modbus_id)
-                        if _modbus_coordinator:
-                            entity = _modbus_coordinator.get_entity_by_name(
-                                sensor_id
-                            )
-                            if not entity:
-                                _LOGGER.warning(
-                                    "Sensor %s not found", sensor_id
-                                )
-                                continue
-                            short_name = "".join(
-                                [x[:3] for x in entity.name.split()]
-                            )
-                            output[short_name] = (
-                                f"{round(entity.state, 2)} {entity.unit_of_measurement}"
-                            )
-                    elif sensor_type == "dallas":
-                        for single_sensor in manager.temp_sensors:
-                            if sensor_id == single_sensor.id.lower():
-                                output[single_sensor.name] = (
-                                    f"{round(single_sensor.state, 2)} C"
-                                )
-                return output
+                return {
+                    label: f"{round(entity.state, 2)} {unit}"
+                    for label, entity, unit in resolved_extra_sensors
+                }
 
             host_stats["extra_sensors"] = {
                 "f": get_extra_sensors_values,
@@ -319,6 +346,37 @@ class HostData:
         }
         self._loop = asyncio.get_running_loop()
 
+    @staticmethod
+    def _resolve_extra_sensors(
+        manager: Manager, extra_sensors: List[dict]
+    ) -> List[tuple[str, Any, str]]:
+        """Resolve configured extra screen sensors to entities once.
+
+        Returns list of (label, entity, unit) so OLED refresh doesn't
+        have to look up coordinators and entities on every tick.
+        """
+        resolved = []
+        for sensor in extra_sensors[:3]:
+            sensor_type = sensor.get("sensor_type")
+            sensor_id = sensor.get("sensor_id")
+            if sensor_type == "modbus":
+                modbus_id = sensor.get("modbus_id")
+                _modbus_coordinator = manager.modbus_coordinators.get(modbus_id)
+                if not _modbus_coordinator:
+                    _LOGGER.warning("Modbus coordinator %s not found", modbus_id)
+                    continue
+                entity = _modbus_coordinator.get_entity_by_name(sensor_id)
+                if not entity:
+                    _LOGGER.warning("Sensor %s not found", sensor_id)
+                    continue
+                short_name = "".join([x[:3] for x in entity.name.split()])
+                resolved.append((short_name, entity, entity.unit_of_measurement))
+            elif sensor_type == "dallas":
+                for single_sensor in manager.temp_sensors:
+                    if sensor_id == single_sensor.id.lower():
+                        resolved.append((single_sensor.name, single_sensor, "C"))
+        return resolved
+
     @property
     def web_url(self) -> str | None:
         if not self._manager.is_web_on:
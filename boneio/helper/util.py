@@ -1,6 +1,8 @@
 import json
+import math
 import os
 import unicodedata
+from functools import lru_cache
 from typing import Any, Callable, TypeVar
 
 CALLABLE_T = TypeVar("CALLABLE_T", bound=Callable[..., Any])
@@ -18,8 +20,12 @@ def is_callback(func: Callable[..., Any]) -> bool:
     return getattr(func, "_boneio_callback", False) is True
 
 
+@lru_cache(maxsize=1024)
 def strip_accents(s):
-    """Remove accents and spaces from a string."""
+    """Remove accents and spaces from a string.
+
+    Cached, as the same ids are stripped for topics, actions and groups.
+    """
     return "".join(
         c
         for c in unicodedata.normalize("NFD", s)
@@ -27,6 +33,16 @@ def strip_accents(s):
     )
 
 
+def state_payload(state: float) -> str:
+    """Serialize {"state": <float>} without building a dict for json.dumps.
+
+    NaN and infinity have no JSON form and are sent as null.
+    """
+    if not math.isfinite(state):
+        return '{"state": null}'
+    return '{"state": %r}' % state
+
+
 def sanitize_mqtt_topic(name: str) -> str:
     """
     Sanitize a string to be used as an MQTT topic:
@@ -92,7 +92,7 @@ from boneio.message_bus import MessageBus
 from boneio.modbus.client import Modbus
 from boneio.modbus.coordinator import ModbusCoordinator
 from boneio.models import OutputState
-from boneio.relay.basic import BasicRelay
+from boneio.relay.basic import BasicRelay, subscribe_virtual_energy_topics
 from boneio.sensor.temp import TempSensor
 
 _LOGGER = logging.getLogger(__name__)
@@ -188,6 +188,7 @@ class Manager:
             expander_config=mcp23017,
             exp_type=MCP,
             i2cbusio=self._i2cbusio,
+            gpio_manager=self.gpio_manager,
         )
         self.grouped_outputs_by_expander.update(
             create_expander(
@@ -195,6 +196,7 @@ class Manager:
                 expander_config=pcf8575,
                 exp_type=PCF,
                 i2cbusio=self._i2cbusio,
+                gpio_manager=self.gpio_manager,
             )
         )
         self.grouped_outputs_by_expander.update(
@@ -245,6 +247,7 @@ class Manager:
                     ),
                 )
             self._loop.create_task(self._delayed_send_state(out))
+        self._loop.create_task(subscribe_virtual_energy_topics())
 
         if self._outputs:
             self._configure_covers()
@@ -18,6 +18,11 @@ class MessageBus(ABC):
         """Send a message."""
         pass
 
+    def send_messages(self, messages: list[tuple[str, Union[str, dict]]], retain: bool = False) -> None:
+        """Send several messages collected in one update cycle."""
+        for topic, payload in messages:
+            self.send_message(topic=topic, payload=payload, retain=retain)
+
     @property
     @abstractmethod
     def state(self) -> bool:
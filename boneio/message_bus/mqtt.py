@@ -170,6 +170,22 @@ class MQTTClient(MessageBus):
         )
         self.publish_queue.put_nowait(to_publish)
 
+    def send_messages(
+        self,
+        messages: list[tuple[str, Union[str, int, dict, None]]],
+        retain: bool = False,
+    ) -> None:
+        """Queue several messages from one update cycle back to back."""
+        put_nowait = self.publish_queue.put_nowait
+        for topic, payload in messages:
+            put_nowait(
+                (
+                    topic,
+                    json.dumps(payload) if type(payload) is dict else payload,
+                    retain,
+                )
+            )
+
     async def _handle_publish(self) -> None:
         """Publish messages as they are put on the queue."""
         while True:
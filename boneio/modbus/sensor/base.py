@@ -42,7 +42,7 @@ class BaseSensor(Filter):
         self._message_bus = message_bus
         self._config_helper = config_helper
         self._user_filters = user_filters
-        self._filters = filters
+        self.set_filters(filters)
         self._value = None
         self._return_type = return_type
         self._value_type = value_type
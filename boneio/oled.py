@@ -18,18 +18,35 @@ from boneio.helper import (
     TimePeriod,
     make_font,
 )
-from boneio.helper.events import EventBus, async_track_point_in_time, utcnow
+from boneio.helper.events import EventBus
 from boneio.helper.gpiod import GpioManager
 from boneio.models import InputState, OutputState, SensorState
 
 _LOGGER = logging.getLogger(__name__)
 
-fonts = {
-    "big": make_font("DejaVuSans.ttf", 12),
-    "small": make_font("DejaVuSans.ttf", 9),
-    "extraSmall": make_font("DejaVuSans.ttf", 7),
-    "danube": make_font("danube__.ttf", 15, local=True),
-}
+
+class _Fonts:
+    """Load fonts on first use instead of at module import."""
+
+    _definitions = {
+        "big": ("DejaVuSans.ttf", 12, False),
+        "small": ("DejaVuSans.ttf", 9, False),
+        "extraSmall": ("DejaVuSans.ttf", 7, False),
+        "danube": ("danube__.ttf", 15, True),
+    }
+
+    def __init__(self) -> None:
+        self._cache = {}
+
+    def __getitem__(self, key: str):
+        font = self._cache.get(key)
+        if font is None:
+            name, size, local = self._definitions[key]
+            font = self._cache[key] = make_font(name, size, local=local)
+        return font
+
+
+fonts = _Fonts()
 
 # screen_order = [UPTIME, NETWORK, CPU, DISK, MEMORY, SWAP]
 
@@ -239,10 +256,8 @@ class Oled:
         else:
             self._handle_press(pin=None)
         if not self._cancel_sleep_handle and self._sleep_timeout.total_seconds > 0:
-            self._cancel_sleep_handle = async_track_point_in_time(
-                loop=self._loop,
-                job=lambda x: self._sleeptime(),
-                point_in_time=utcnow() + self._sleep_timeout.as_timedelta,
+            self._cancel_sleep_handle = self._loop.call_later(
+                self._sleep_timeout.total_in_seconds, self._sleeptime
             )
 
     async def _output_callback(self, event: OutputState):
@@ -269,7 +284,7 @@ class Oled:
     def _handle_press(self, pin: any) -> None:
         """Handle press of PIN for OLED display."""
         if self._cancel_sleep_handle:
-            self._cancel_sleep_handle()
+            self._cancel_sleep_handle.cancel()
             self._cancel_sleep_handle = None
         if not self._sleep:
             self._event_bus.remove_event_listener(listener_id=f"oled_{self._current_screen}")
@@ -1,7 +1,7 @@
 """Relay module."""
 from boneio.relay.gpio import GpioRelay
 from boneio.relay.mcp import MCPRelay
-from boneio.relay.pcf import PCFRelay
 from boneio.relay.pca import PWMPCA
+from boneio.relay.pcf import PCFRelay
 
-__all__ = ["MCPRelay", "GpioRelay", "PWMPCA", "PCFRelay"]
+__all__ = ["GpioRelay", "MCPRelay", "PWMPCA", "PCFRelay"]
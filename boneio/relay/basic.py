@@ -4,11 +4,13 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import sys
 import time
+from typing import Awaitable, Callable
 
 from boneio.const import COVER, LIGHT, NONE, OFF, ON, RELAY, STATE, SWITCH
 from boneio.helper import BasicMqtt
-from boneio.helper.events import EventBus, async_track_point_in_time, utcnow
+from boneio.helper.events import EventBus
 from boneio.helper.interlock import SoftwareInterlockManager
 from boneio.helper.util import callback
 from boneio.message_bus.basic import MessageBus
@@ -16,44 +18,171 @@ from boneio.models import OutputState
 
 _LOGGER = logging.getLogger(__name__)
 
+VIRTUAL_SENSORS_UPDATE_INTERVAL = 30
+MICRO = 1_000_000
+# W * s -> uWh (and L/h * s -> uL).
+MICRO_PER_HOUR = MICRO / 3600
+
+# Relay state can only be ON or OFF, so serialize both payloads once.
+STATE_PAYLOADS = {ON: json.dumps({STATE: ON}), OFF: json.dumps({STATE: OFF})}
+# Outputs whose pin state is never restored after restart.
+_NON_RESTORABLE_TYPES = frozenset((COVER, NONE))
+
+
+def log_relay_setup(kind: str, pin_id: int | str) -> None:
+    """Log relay construction, skipped entirely unless DEBUG is on."""
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Setup %s with pin %s", kind, pin_id)
+
+
+class _VirtualSensorsScheduler:
+    """One shared timer publishing all running virtual energy sensors.
+
+    Replaces a sleeping task per relay with a single call_later handle which
+    exists only while at least one relay with virtual sensors is ON.
+    """
+
+    __slots__ = ("_active", "_handle")
+
+    def __init__(self) -> None:
+        self._active: set[VirtualEnergySensor] = set()
+        self._handle: asyncio.TimerHandle | None = None
+
+    def add(self, sensor: VirtualEnergySensor, loop: asyncio.AbstractEventLoop) -> None:
+        """Start publishing sensor periodically."""
+        self._active.add(sensor)
+        if self._handle is None:
+            self._handle = loop.call_later(
+                VIRTUAL_SENSORS_UPDATE_INTERVAL, self._run, loop
+            )
+
+    def discard(self, sensor: VirtualEnergySensor) -> None:
+        """Stop publishing sensor periodically."""
+        self._active.discard(sensor)
+        if not self._active and self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def is_active(self, sensor: VirtualEnergySensor) -> bool:
+        return sensor in self._active
+
+    def _run(self, loop: asyncio.AbstractEventLoop) -> None:
+        now = loop.time()
+        for sensor in list(self._active):
+            if sensor.parent_is_on:
+                sensor._update_virtual_sensors(now)
+            else:
+                # Turned off without send_state (e.g. directly from a cover
+                # thread); when exactly is unknown, so don't integrate.
+                sensor.stop_virtual_sensors_task(integrate=False)
+        self._handle = (
+            loop.call_later(VIRTUAL_SENSORS_UPDATE_INTERVAL, self._run, loop)
+            if self._active
+            else None
+        )
+
+
+_virtual_sensors_scheduler = _VirtualSensorsScheduler()
+
+
+_pending_energy_subscriptions: list[
+    tuple[MessageBus, str, Callable[[str, str], Awaitable[None]]]
+] = []
+
+
+async def subscribe_virtual_energy_topics() -> None:
+    """Subscribe retained energy topics of all relays configured so far.
+
+    Called once by the manager after outputs are configured, instead of
+    every relay scheduling its own subscribe task.
+    """
+    while _pending_energy_subscriptions:
+        message_bus, topic, listener = _pending_energy_subscriptions.pop(0)
+        await message_bus.subscribe_and_listen(topic, listener)
+
+
+def _parse_energy_payload(payload: str) -> tuple[float | None, float | None]:
+    """Parse retained energy payload into (energy Wh, water L).
+
+    Raises ValueError if payload is not a JSON object.
+    """
+    data = json.loads(payload)
+    if not isinstance(data, dict):
+        raise ValueError(f"Invalid retained payload: {payload}")
+    energy = data.get("energy")
+    water = data.get("water")
+    return (
+        float(energy) if energy is not None else None,
+        float(water) if water is not None else None,
+    )
+
 
 class VirtualEnergySensor:
 
+    __slots__ = (
+        "_loop",
+        "_now",
+        "_message_bus",
+        "_parent",
+        "_virtual_power_usage",
+        "_virtual_volume_flow_rate",
+        "_energy_consumed_uWh",
+        "_water_consumed_uL",
+        "_last_on_timestamp",
+        "_virtual_energy_topic",
+    )
+
     def __init__(self, message_bus: MessageBus, loop: asyncio.AbstractEventLoop, topic_prefix: str, parent: BasicRelay, virtual_power_usage: float | None = None, virtual_volume_flow_rate: float | None = None):
         self._loop = loop or asyncio.get_running_loop()
+        # Monotonic clock, immune to NTP steps while integrating energy.
+        self._now = self._loop.time
         self._message_bus = message_bus
-        self._virtual_sensors_task = None
         self._parent = parent
         self._virtual_power_usage = virtual_power_usage
         self._virtual_volume_flow_rate = virtual_volume_flow_rate
         # --- Virtual energy counter ---
-        self._energy_consumed_Wh = 0.0
-        self._water_consumed_L = 0.0
-        self._last_on_timestamp = time.time() if self._parent.state == ON else None
-        self._virtual_energy_topic = f"{topic_prefix}/energy/{self._parent.id}"
+        # Integer micro units, so long running accumulation doesn't drift.
+        self._energy_consumed_uWh = 0
+        self._water_consumed_uL = 0
+        self._last_on_timestamp = self._now() if self._parent.state == ON else None
+        self._virtual_energy_topic = sys.intern(f"{topic_prefix}/energy/{self._parent.id}")
         self._subscribe_restore_energy_state()
 
     def start_virtual_sensors_task(self):
-        """Start periodic task to update and send virtual energy state every 30 seconds."""
-        self._last_on_timestamp = time.time()
-        if self._virtual_sensors_task is not None and not self._virtual_sensors_task.done():
+        """Start publishing virtual energy state every 30 seconds.
+
+        Energy is integrated on each publish and on stop, so no task has to
+        wake up in between.
+        """
+        if _virtual_sensors_scheduler.is_active(self):
             return  # Already running
-        self._virtual_sensors_task = self._loop.create_task(self._virtual_sensors_loop())
+        self._last_on_timestamp = self._now()
+        _virtual_sensors_scheduler.add(self, self._loop)
+        self.send_virtual_energy_state()
         _LOGGER.info(f"Started periodic virtual sensors task for {self._parent.id}")
 
-    def stop_virtual_sensors_task(self):
-        """Stop periodic virtual energy update task."""
-        self._last_on_timestamp = None
-        if self._virtual_sensors_task is not None:
-            self._virtual_sensors_task.cancel()
-            self._virtual_sensors_task = None
-            self._update_virtual_sensors()
+    def stop_virtual_sensors_task(self, integrate: bool = True):
+        """Stop periodic virtual energy updates and publish final state.
+
+        ``integrate`` adds the time since the last update as ON time; it is
+        False when the relay is already found OFF by the scheduler.
+        """
+        if _virtual_sensors_scheduler.is_active(self):
+            _virtual_sensors_scheduler.discard(self)
+            if integrate:
+                self._update_virtual_energy()
+            self.send_virtual_energy_state()
             _LOGGER.info(f"Stopped periodic virtual sensors task for {self._parent.id}")
+        self._last_on_timestamp = None
 
     @property
     def last_on_timestamp(self) -> float | None:
         return self._last_on_timestamp
 
+    @property
+    def parent_is_on(self) -> bool:
+        return self._parent.state == ON
+
     @property
     def virtual_power_usage(self) -> float | None:
         return self._virtual_power_usage
@@ -62,60 +191,58 @@ class VirtualEnergySensor:
     def virtual_volume_flow_rate(self) -> float | None:
         return self._virtual_volume_flow_rate
 
-    async def _virtual_sensors_loop(self):
-        """Periodically update and send virtual energy state every 30 seconds while relay is ON."""
-        try:
-            while self._parent.state == ON:
-                self._update_virtual_sensors()
-                await asyncio.sleep(30)
-        except asyncio.CancelledError:
-            pass
-
-    def _update_virtual_sensors(self):
+    def _update_virtual_sensors(self, now: float | None = None):
         """Update virtual sensors if virtual_power_usage is set."""
         if self.virtual_power_usage is not None or self.virtual_volume_flow_rate is not None:
-            self._update_virtual_energy()
+            self._update_virtual_energy(now)
             self.send_virtual_energy_state()
 
 
-    def _update_virtual_energy(self):
-        """Update energy counter if virtual_power_usage is set."""
-        now = time.time()
-        if self._parent.state == ON and self._last_on_timestamp is not None:
-            elapsed = now - self._last_on_timestamp
-            if self.virtual_power_usage is not None:
-                self._energy_consumed_Wh += (self.virtual_power_usage * elapsed) / 3600.0
-                _LOGGER.debug(f"Energy updated for {self._parent.id}: {self._energy_consumed_Wh:.4f} Wh")
-            if self.virtual_volume_flow_rate is not None:
-                self._water_consumed_L += (self.virtual_volume_flow_rate * elapsed) / 3600.0
-                _LOGGER.debug(f"Volume flow rate updated for {self._parent.id}: {self._water_consumed_L:.4f} L")
-            self._last_on_timestamp = now
+    def _update_virtual_energy(self, now: float | None = None):
+        """Integrate energy consumed since the last update while relay was ON."""
+        last_on_timestamp = self._last_on_timestamp
+        if last_on_timestamp is None:
+            return
+        if now is None:
+            now = self._now()
+        elapsed = now - last_on_timestamp
+        power_usage = self._virtual_power_usage
+        volume_flow_rate = self._virtual_volume_flow_rate
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if power_usage is not None:
+            self._energy_consumed_uWh += round(power_usage * elapsed * MICRO_PER_HOUR)
+            if debug:
+                _LOGGER.debug("Energy updated for %s: %.4f Wh", self._parent.id, self._energy_consumed_uWh / MICRO)
+        if volume_flow_rate is not None:
+            self._water_consumed_uL += round(volume_flow_rate * elapsed * MICRO_PER_HOUR)
+            if debug:
+                _LOGGER.debug("Volume flow rate updated for %s: %.4f L", self._parent.id, self._water_consumed_uL / MICRO)
+        self._last_on_timestamp = now
+
+    async def _on_energy_message(self, _topic: str, payload: str) -> None:
+        """Restore energy counters from retained MQTT payload."""
+        try:
+            energy, water = _parse_energy_payload(payload)
+            if energy is not None:
+                self._energy_consumed_uWh = round(energy * MICRO)
+                _LOGGER.info(f"Restored energy state for {self._parent.id} from MQTT: {energy:.4f} Wh")
+            if water is not None:
+                self._water_consumed_uL = round(water * MICRO)
+                _LOGGER.info(f"Restored water consumption state for {self._parent.id} from MQTT: {water:.4f} L")
+        except (ValueError, TypeError) as e:
+            _LOGGER.warning(f"Failed to restore energy state for {self._parent.id} from MQTT: {e}")
+        finally:
+            await self._message_bus.unsubscribe_and_stop_listen(self._virtual_energy_topic)
 
     def _subscribe_restore_energy_state(self):
         """
         Subscribe to the retained MQTT topic for energy and restore state if available.
         """
-        async def on_energy_message(_topic, payload):
-            try:
-                payload = json.loads(payload)
-                if isinstance(payload, dict):
-                    if "energy" in payload:
-                        retained_energy_wh = float(payload["energy"])
-                        self._energy_consumed_Wh = retained_energy_wh
-                        _LOGGER.info(f"Restored energy state for {self._parent.id} from MQTT: {self._energy_consumed_Wh:.4f} Wh")
-                    if "water" in payload:
-                        retained_water_consumption_L = float(payload["water"])
-                        self._water_consumed_L = retained_water_consumption_L
-                        _LOGGER.info(f"Restored water consumption state for {self._parent.id} from MQTT: {self._water_consumed_L:.4f} L")
-                else:
-                    _LOGGER.warning(f"Invalid retained payload for {self._parent.id}: {payload}")
-            except Exception as e:
-                _LOGGER.warning(f"Failed to restore energy state for {self._parent.id} from MQTT: {e}")
-            finally:
-                await self._message_bus.unsubscribe_and_stop_listen(self._virtual_energy_topic)
-        # Subscribe (works for both LocalMessageBus and MQTTClient)
-        if hasattr(self, '_message_bus') and self._message_bus is not None:
-            asyncio.create_task(self._message_bus.subscribe_and_listen(self._virtual_energy_topic, on_energy_message))
+        # Subscribed in batch by subscribe_virtual_energy_topics.
+        if self._message_bus is not None:
+            _pending_energy_subscriptions.append(
+                (self._message_bus, self._virtual_energy_topic, self._on_energy_message)
+            )
         else:
             _LOGGER.warning(f"Message bus not available for {self._parent.id}, cannot subscribe for retained energy.")
 
@@ -125,7 +252,7 @@ class VirtualEnergySensor:
 
     def get_virtual_energy(self) -> float:
         """Return current virtual energy in Wh."""
-        return round(self._energy_consumed_Wh, 3)
+        return round(self._energy_consumed_uWh / MICRO, 3)
 
     def get_virtual_volume_flow_rate(self) -> float:
         """Return current virtual volume flow rate in L/h."""
@@ -133,7 +260,7 @@ class VirtualEnergySensor:
 
     def get_virtual_water_consumption(self) -> float:
         """Return current virtual water consumption in L."""
-        return round(self._water_consumed_L, 3)
+        return round(self._water_consumed_uL / MICRO, 3)
 
     def send_virtual_energy_state(self):
         """Send virtual power/energy state to MQTT for Home Assistant."""
@@ -149,12 +276,31 @@ class VirtualEnergySensor:
             payload=payload,
             retain=True,
         )
-        _LOGGER.info(f"Sent virtual energy state for {self._parent.id}: {payload}")
+        _LOGGER.debug("Sent virtual energy state for %s: %s", self._parent.id, payload)
 
 
 class BasicRelay(BasicMqtt):
     """Basic relay class."""
 
+    __slots__ = (
+        "_momentary_turn_on",
+        "_momentary_turn_off",
+        "_has_momentary",
+        "_output_type",
+        "_event_bus",
+        "_interlock_manager",
+        "_interlock_groups",
+        "_restored_state",
+        "_state",
+        "_momentary_action",
+        "_last_timestamp",
+        "_pending_state",
+        "_loop",
+        "_virtual_energy_sensor",
+        "_pin_id",
+        "_expander_id",
+    )
+
     def __init__(
         self,
         # callback: Callable[[OutputState], Awaitable[None]],
@@ -185,10 +331,15 @@ class BasicRelay(BasicMqtt):
         if output_type == COVER:
             self._momentary_turn_on = None
             self._momentary_turn_off = None
+        # Without momentary config there is never a timer to set or cancel.
+        self._has_momentary = bool(self._momentary_turn_on or self._momentary_turn_off)
+        restored_state = restored_state and output_type not in _NON_RESTORABLE_TYPES
+        self._restored_state = restored_state
         self._state = ON if restored_state else OFF
         # self._callback = callback
         self._momentary_action = None
         self._last_timestamp = 0.0
+        self._pending_state: str | None = None
         self._loop = asyncio.get_running_loop()
         
         # Subscribe to retained MQTT energy value
@@ -202,7 +353,6 @@ class BasicRelay(BasicMqtt):
                 virtual_power_usage=virtual_power_usage,
                 virtual_volume_flow_rate=virtual_volume_flow_rate,
             )
-            self._virtual_sensors_task = None
 
     def set_interlock(self, interlock_manager: SoftwareInterlockManager, interlock_groups: list[str]):
         self._interlock_manager = interlock_manager
@@ -258,40 +408,71 @@ class BasicRelay(BasicMqtt):
 
     async def async_send_state(self, optimized_value: str | None = None) -> None:
         """Send state to Mqtt on action asynchronously."""
-        if optimized_value:
-            state = optimized_value
-        else:
-            state = ON if self.is_active else OFF
+        self.send_state(optimized_value=optimized_value)
+
+    def send_state(self, optimized_value: str | None = None) -> None:
+        """Send state to Mqtt on action.
+
+        Nothing here awaits, so callers on the loop invoke it directly
+        instead of wrapping it in a Task.
+        """
+        state = optimized_value or (ON if self.is_active else OFF)
         self._state = state
-        if self.output_type not in (COVER, NONE):
-            self._message_bus.send_message(
-                topic=self._send_topic,
-                payload={STATE: state},
-                retain=True,
-            )
-            if self._virtual_energy_sensor and not optimized_value:
-                if state == ON:
-                    self._virtual_energy_sensor.start_virtual_sensors_task()
-                elif self._virtual_energy_sensor.last_on_timestamp is not None:
-                    self._virtual_energy_sensor.stop_virtual_sensors_task()
+        output_type = self._output_type
+        publish = output_type != COVER and output_type != NONE
+        if publish:
+            self._queue_state_publish(state)
         if optimized_value:
             return
-        self._last_timestamp = time.time()
-        event = OutputState(
-            id=self.id,
+        virtual_energy_sensor = self._virtual_energy_sensor
+        if publish and virtual_energy_sensor is not None:
+            if state == ON:
+                virtual_energy_sensor.start_virtual_sensors_task()
+            elif virtual_energy_sensor.last_on_timestamp is not None:
+                virtual_energy_sensor.stop_virtual_sensors_task()
+        id = self.id
+        self._last_timestamp = timestamp = time.time()
+        # Fields come straight from the relay, so skip pydantic validation.
+        event = OutputState.model_construct(
+            id=id,
             name=self.name,
             state=state,
-            type=self.output_type,
+            type=output_type,
             pin=self.pin_id,
-            timestamp=self.last_timestamp,
+            timestamp=timestamp,
             expander_id=self.expander_id,
         )
         self._event_bus.trigger_event({
-            "event_type": "output", 
-            "entity_id": self.id, 
+            "event_type": "output",
+            "entity_id": id,
             "event_state": event
         })
-        
+
+    def _queue_state_publish(self, state: str) -> None:
+        """Publish state on the next loop iteration.
+
+        Back-to-back calls within one iteration collapse into a single
+        publish of the last state.
+        """
+        if self._pending_state is None:
+            self._loop.call_soon(self._flush_state)
+        self._pending_state = state
+
+    def _flush_state(self) -> None:
+        """Publish the last state queued in this iteration.
+
+        Only the burst is collapsed; a state equal to an earlier publish is
+        sent again, so a publish lost during a reconnect is not masked.
+        """
+        state = self._pending_state
+        self._pending_state = None
+        if state is None:
+            return
+        self._message_bus.send_message(
+            topic=self._send_topic,
+            payload=STATE_PAYLOADS[state],
+            retain=True,
+        )
 
     def check_interlock(self) -> bool:
         if getattr(self, "_interlock_manager", None) and getattr(self, "_interlock_groups", None):
@@ -301,26 +482,27 @@ class BasicRelay(BasicMqtt):
     async def async_turn_on(self, timestamp=None) -> None:
         """Turn on the relay asynchronously."""
         can_turn_on = self.check_interlock()
-        if can_turn_on:
-            await self._loop.run_in_executor(None, self.turn_on, timestamp)
-        else:
+        if not can_turn_on:
             _LOGGER.warning(f"Interlock active: cannot turn on {self.id}.")
             #Workaround for HA is sendind state ON/OFF without physically changing the relay.
-            asyncio.create_task(self.async_send_state(optimized_value=ON))
-            await asyncio.sleep(0.01)
-        asyncio.create_task(self.async_send_state())
-        
+            self.send_state(optimized_value=ON)
+            self._loop.call_soon(self.send_state)
+            return
+        # Pin write is a single short expander transaction. Running it on the
+        # loop also keeps momentary timers being scheduled from the
+        # loop thread.
+        self.turn_on(timestamp)
+        self.send_state()
 
     async def async_turn_off(self, timestamp=None) -> None:
         """Turn off the relay asynchronously."""
-        await self._loop.run_in_executor(None, self.turn_off, timestamp)
-        await self.async_send_state()
+        self.turn_off(timestamp)
+        self.send_state()
 
 
     async def async_toggle(self, timestamp=None) -> None:
         """Toggle relay."""
-        now = time.time()
-        _LOGGER.debug("Toggle relay %s, state: %s, at %s.", self.name, self.state, now)
+        _LOGGER.debug("Toggle relay %s, state: %s, at %s.", self.name, self.state, self._loop.time())
         if self.state == ON:
             await self.async_turn_off(timestamp=timestamp)
         else:
@@ -334,30 +516,37 @@ class BasicRelay(BasicMqtt):
         """Call turn off action."""
         raise NotImplementedError
 
-    def _execute_momentary_turn(self, momentary_type: str) -> None:
-        """Execute momentary action."""
+    def _execute_momentary_turn_on(self) -> None:
+        """Cancel any pending momentary action, schedule off after turn on."""
+        self._schedule_momentary(self.async_turn_off, self._momentary_turn_on)
+
+    def _execute_momentary_turn_off(self) -> None:
+        """Cancel any pending momentary action, schedule on after turn off."""
+        self._schedule_momentary(self.async_turn_on, self._momentary_turn_off)
+
+    def _schedule_momentary(self, action, delayed_action) -> None:
         if self._momentary_action:
             _LOGGER.debug("Cancelling momentary action for %s", self.name)
-            self._momentary_action()
-        (action, delayed_action) = (
-            (self.async_turn_off, self._momentary_turn_on)
-            if momentary_type == ON
-            else (self.async_turn_on, self._momentary_turn_off)
-        )
+            self._momentary_action.cancel()
+            self._momentary_action = None
         if delayed_action:
             _LOGGER.debug("Applying momentary action for %s in %s", self.name, delayed_action.as_timedelta)
-            self._momentary_action = async_track_point_in_time(
-                loop=self._loop,
-                job=self._momentary_callback,
-                point_in_time=utcnow() + delayed_action.as_timedelta,
-                action=action,
+            self._momentary_action = self._loop.call_later(
+                delayed_action.total_in_seconds,
+                self._run_momentary_action,
+                action,
             )
 
     @callback
+    def _run_momentary_action(self, action) -> None:
+        self._loop.create_task(
+            self._momentary_callback(timestamp=time.time(), action=action)
+        )
+
     async def _momentary_callback(self, timestamp, action):
         _LOGGER.info("Momentary callback at %s for output %s", timestamp, self.name)
-        await action(timestamp=timestamp)
         self._momentary_action = None
+        await action(timestamp=timestamp)
 
     @property
     def is_active(self) -> bool:
@@ -0,0 +1,100 @@
+"""Relay on a 16-bit I2C GPIO expander port."""
+
+from __future__ import annotations
+
+import logging
+
+from boneio.const import OFF, ON, SWITCH
+from boneio.helper.mcp23017 import MCP23017
+from boneio.helper.pcf8575 import PCF8575
+from boneio.relay.basic import BasicRelay, log_relay_setup
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ExpanderRelay(BasicRelay):
+    """Relay driven by one bit of an expander's port word.
+
+    Subclasses only say how to read the port word and how to drive one
+    pin on the chip.
+    """
+
+    __slots__ = ("_pin", "_expander", "_bit")
+
+    # Pin level which means the relay is on.
+    _active_state = True
+
+    def __init__(
+        self,
+        pin: int,
+        expander: MCP23017 | PCF8575,
+        expander_id: str,
+        output_type: str = SWITCH,
+        restored_state: bool = False,
+        **kwargs,
+    ) -> None:
+        """Initialize expander relay."""
+        self._pin = expander.get_pin(pin)
+        super().__init__(
+            **kwargs, output_type=output_type, restored_state=restored_state
+        )
+        self._pin_id = pin
+        self._expander = expander
+        # State lives in the chip's 16-bit port word shared by every relay
+        # on this expander; each relay only keeps its bit.
+        self._bit = 1 << pin
+        self._expander_id = expander_id
+
+        self.init_with_check_if_can_restore_state(
+            restored_state=self._restored_state
+        )
+        log_relay_setup(self.expander_type, self._pin_id)
+
+    def init_with_check_if_can_restore_state(self, restored_state: bool) -> None:
+        if restored_state:
+            interlock_manager = getattr(self, "_interlock_manager", None)
+            interlock_groups = getattr(self, "_interlock_groups", None)
+            if self._interlock_manager and self._interlock_groups:
+                if not interlock_manager.can_turn_on(self, interlock_groups):
+                    _LOGGER.warning(
+                        f"Interlock active: cannot restore ON state for {self._pin_id} at startup"
+                    )
+                    restored_state = False
+        self._pin.switch_to_output(value=restored_state == self._active_state)
+
+    def _read_port(self) -> int:
+        """Return the expander's 16-bit port word."""
+        raise NotImplementedError
+
+    def _write_pin(self, value: bool) -> None:
+        """Drive this relay's pin to ``value``."""
+        raise NotImplementedError
+
+    @property
+    def pin_id(self) -> int:
+        """Return PIN id."""
+        return self._pin_id
+
+    @property
+    def is_active(self) -> bool:
+        """Is relay active."""
+        return bool(self._read_port() & self._bit) == self._active_state
+
+    @property
+    def pin(self):
+        """PIN of the relay"""
+        return self._pin
+
+    def turn_on(self, time=None) -> None:
+        """Call turn on action."""
+        self._write_pin(self._active_state)
+        self._state = ON
+        if not time and self._has_momentary:
+            self._execute_momentary_turn_on()
+
+    def turn_off(self, time=None) -> None:
+        """Call turn off action."""
+        self._write_pin(not self._active_state)
+        self._state = OFF
+        if not time and self._has_momentary:
+            self._execute_momentary_turn_off()
@@ -3,25 +3,23 @@
 Created just in case.
 """
 
-import logging
-
 from boneio.const import HIGH, LOW
 from boneio.helper.gpiod import GpioManager
-from boneio.relay.basic import BasicRelay
-
-_LOGGER = logging.getLogger(__name__)
+from boneio.relay.basic import BasicRelay, log_relay_setup
 
 
 class GpioRelay(BasicRelay):
     """Represents GPIO Relay output"""
 
+    __slots__ = ("_pin", "_gpio_manager")
+
     def __init__(self, pin: str, gpio_manager: GpioManager, **kwargs) -> None:
         """Initialize Gpio relay."""
         super().__init(**kwargs)
         self._pin = pin
         self._gpio_manager = gpio_manager
         self._gpio_manager.write(self._pin, LOW)
-        _LOGGER.debug("Setup relay with pin %s", self._pin)
+        log_relay_setup("relay", self._pin)
 
     @property
     def is_active(self) -> bool:
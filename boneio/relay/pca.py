@@ -4,15 +4,27 @@ from __future__ import annotations
 import logging
 from adafruit_pca9685 import PCA9685, PCAChannels
 
-from boneio.const import LED, OFF, ON, STATE, SWITCH, BRIGHTNESS, PCA
-from boneio.relay.basic import BasicRelay
+from boneio.const import LED, STATE, SWITCH, BRIGHTNESS, PCA
+from boneio.relay.basic import BasicRelay, log_relay_setup
 
 _LOGGER = logging.getLogger(__name__)
 
+# Brightness reads within this window reuse the last read/written duty.
+DUTY_CACHE_TTL = 0.05
+
 
 class PWMPCA(BasicRelay):
     """Initialize PWMPCA."""
 
+    __slots__ = (
+        "_pin",
+        "_percentage_default_brightness",
+        "_default_duty",
+        "_last_duty",
+        "_last_duty_ts",
+        "_brightness",
+    )
+
     def __init__(
         self,
         pin: int,
@@ -29,9 +41,12 @@ class PWMPCA(BasicRelay):
             **kwargs, output_type=output_type, restored_state=restored_state
         )
         self._percentage_default_brightness = percentage_default_brightness
-        self._brightness = restored_brightness if restored_state else 0
+        self._default_duty = (65535 * percentage_default_brightness) // 100
+        self._last_duty: int | None = None
+        self._last_duty_ts = 0.0
+        self._brightness = restored_brightness if self._restored_state else 0
         self._pin_id = pin
-        _LOGGER.debug("Setup PCA with pin %s", self._pin_id)
+        log_relay_setup("PCA", self._pin_id)
 
     @property
     def expander_type(self) -> str:
@@ -46,10 +61,16 @@ class PWMPCA(BasicRelay):
     @property
     def brightness(self) -> int:
         """Get brightness in 0-65535 scale. PCA can force over 65535 value after restart, so we treat that as a 0"""
+        now = self._loop.time()
+        if self._last_duty is not None and now - self._last_duty_ts < DUTY_CACHE_TTL:
+            return self._last_duty
         try:
-            if self._pin.duty_cycle > 65535:
-                return 0
-            return self._pin.duty_cycle
+            duty_cycle = self._pin.duty_cycle
+            if duty_cycle > 65535:
+                duty_cycle = 0
+            self._last_duty = duty_cycle
+            self._last_duty_ts = now
+            return duty_cycle
         except:
             _LOGGER.error("Cant read value form driver on pin %s", self._pin_id)
             return 0
@@ -59,6 +80,8 @@ class PWMPCA(BasicRelay):
             """Set brightness in 0-65535 vale"""
             _LOGGER.debug("Set brightness relay %s.", value)
             self._pin.duty_cycle = value
+            self._last_duty = value
+            self._last_duty_ts = self._loop.time()
         except:
             _LOGGER.error("Cant set value form driver on pin %s", self._pin_id)
 
@@ -71,18 +94,20 @@ class PWMPCA(BasicRelay):
         """Call turn on action. When brightness is 0, and turn on by switch, default set value to 1%"""
         _LOGGER.debug("Turn on relay.")
         if self.brightness == 0:
-            self.set_brightness(int(65535 / 100 * self._percentage_default_brightness))
-        self._execute_momentary_turn(momentary_type=ON)
+            self.set_brightness(self._default_duty)
+        if self._has_momentary:
+            self._execute_momentary_turn_on()
         self._loop.call_soon_threadsafe(self.send_state)
-        self._loop.call_soon_threadsafe(self._callback)
 
     def turn_off(self) -> None:
         """Call turn off action."""
         _LOGGER.debug("Turn off relay.")
         self._pin.duty_cycle = 0
-        self._execute_momentary_turn(momentary_type=OFF)
+        self._last_duty = 0
+        self._last_duty_ts = self._loop.time()
+        if self._has_momentary:
+            self._execute_momentary_turn_off()
         self._loop.call_soon_threadsafe(self.send_state)
-        self._loop.call_soon_threadsafe(self._callback)
 
     def payload(self) -> dict:
         return {BRIGHTNESS: self.brightness, STATE: self.state}
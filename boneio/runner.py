@@ -53,6 +53,11 @@ warnings.filterwarnings('ignore', category=DeprecationWarning, module='cryptogra
 
 _LOGGER = logging.getLogger(__name__)
 
+# Python 3.12+: run a task's synchronous prologue immediately on creation.
+_eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+# Seconds to wait for cancelled tasks to unwind before giving up.
+SHUTDOWN_TIMEOUT = 5.0
+
 config_modules = [
     {"name": MCP23017, "default": []},
     {"name": PCF8575, "default": []},
@@ -78,8 +83,10 @@ async def async_run(
     web_server = None
     tasks: Set[asyncio.Task] = set()
     event_bus = EventBus(loop=asyncio.get_event_loop())
-    shutdown_event = asyncio.Event()
     loop = asyncio.get_event_loop()
+    # A bare future can be passed to asyncio.wait without wrapping
+    # Event.wait() in its own task.
+    shutdown_requested = loop.create_future()
     if debug >= 2:
         loop.set_debug(True)
     network_state = get_network_info()
@@ -87,15 +94,24 @@ async def async_run(
     def signal_handler():
         """Handle shutdown signals."""
         _LOGGER.info("Received shutdown signal, initiating graceful shutdown...")
-        shutdown_event.set()
+        if not shutdown_requested.done():
+            shutdown_requested.set_result(None)
 
     # Register signal handlers
     for sig in (signal.SIGTERM, signal.SIGINT):
         loop.add_signal_handler(sig, signal_handler)
 
-    event_bus_task = asyncio.create_task(event_bus.start())
-    tasks.add(event_bus_task)
-    event_bus_task.add_done_callback(tasks.discard)
+    def start_task(coro, eager: bool = False) -> asyncio.Task:
+        """Create a task owned by this run; it leaves ``tasks`` when done."""
+        if eager and _eager_task_factory is not None:
+            task = _eager_task_factory(loop, coro)
+        else:
+            task = loop.create_task(coro)
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        return task
+
+    start_task(event_bus.start())
 
     main_config = config.get(BONEIO, {})
 
@@ -162,9 +178,7 @@ async def async_run(
 
     message_bus_type = "MQTT" if isinstance(message_bus, MQTTClient) else "Local"
     _LOGGER.info("Starting message bus %s.", message_bus_type)
-    message_bus_task = asyncio.create_task(message_bus.start_client())
-    tasks.add(message_bus_task)
-    message_bus_task.add_done_callback(tasks.discard)
+    start_task(message_bus.start_client(), eager=True)
     
     # Start web server if configured
     if web_active:
@@ -178,32 +192,29 @@ async def async_run(
             logger=config.get("logger", {}),
             debug_level=debug
         )
-        web_server_task = asyncio.create_task(web_server.start_webserver())
-        tasks.add(web_server_task)
-        web_server_task.add_done_callback(tasks.discard)
+        start_task(web_server.start_webserver(), eager=True)
     else:
         _LOGGER.info("Web server not configured.")
     
     try:
-        # Convert tasks set to list for main gather
-        task_list = list(tasks)
-        main_gather = asyncio.gather(*task_list)
-        
+        main_gather = asyncio.gather(*tasks)
         # Wait for either shutdown signal or main task completion
-        await asyncio.wait([
-            main_gather,
-            asyncio.create_task(shutdown_event.wait())
-        ], return_when=asyncio.FIRST_COMPLETED)
-
+        await asyncio.wait(
+            [main_gather, shutdown_requested], return_when=asyncio.FIRST_COMPLETED
+        )
 
-        if shutdown_event.is_set():
+        if shutdown_requested.done():
             _LOGGER.info("Starting graceful shutdown...")
-            await message_bus.announce_offline()
+            announce = loop.create_task(message_bus.announce_offline())
+            # Let the announce hand its packet to the client before the
+            # message bus task starts tearing the connection down.
+            await asyncio.sleep(0)
             main_gather.cancel()
-            try:
-                await main_gather
-            except asyncio.CancelledError:
-                pass
+            await asyncio.wait([announce, main_gather], timeout=SHUTDOWN_TIMEOUT)
+            if not announce.done():
+                announce.cancel()
+            elif not announce.cancelled() and announce.exception():
+                _LOGGER.warning("Failed to announce offline: %s", announce.exception())
 
         return 0
     except asyncio.CancelledError:
@@ -233,14 +244,24 @@ async def async_run(
         if remaining_tasks:
             # Cancel and wait for all remaining tasks
             # Web server task will be cancelled here if it hasn't finished after trigger_shutdown
+            log_debug = _LOGGER.isEnabledFor(logging.DEBUG)
             for task in remaining_tasks:
                 if not task.done():
-                    _LOGGER.debug(f"Cancelling task: {task.get_name() if hasattr(task, 'get_name') else task}")
+                    if log_debug:
+                        _LOGGER.debug("Cancelling task: %s", task.get_name())
                     task.cancel()
             
-            # Wait for all tasks to complete
+            # Wait for all tasks to complete, but don't hang on a stuck one
             try:
-                await asyncio.gather(*remaining_tasks, return_exceptions=True)
+                _, pending = await asyncio.wait(
+                    remaining_tasks, timeout=SHUTDOWN_TIMEOUT
+                )
+                for task in pending:
+                    _LOGGER.warning(
+                        "Task %s did not finish within %ss of shutdown.",
+                        task.get_name(),
+                        SHUTDOWN_TIMEOUT,
+                    )
             except Exception as e:
                 _LOGGER.error(f"Error during cleanup: {type(e).__name__} - {e}")
         
@@ -1,7 +1,10 @@
 """ADC GPIO BBB sensor."""
 
+from __future__ import annotations
+
 import logging
-from pathlib import Path
+import os
+
 from typing_extensions import Literal
 
 from boneio.const import SENSOR
@@ -16,7 +19,19 @@ REFERENCE_VOLTAGE = 1.8
 MAX_ADC_VALUE = 4095
 
 
-def read(
+ADC_PATH = "/sys/bus/iio/devices/iio:device0"
+_PIN_TO_FILE = {
+    "P9_39": "in_voltage0_raw",
+    "P9_40": "in_voltage1_raw",
+    "P9_37": "in_voltage2_raw",
+    "P9_38": "in_voltage3_raw",
+    "P9_33": "in_voltage4_raw",
+    "P9_36": "in_voltage5_raw",
+    "P9_35": "in_voltage6_raw",
+}
+
+
+def open_adc(
     pin: Literal[
         "P9_39",
         "P9_40",
@@ -26,27 +41,27 @@ def read(
         "P9_36",
         "P9_35",
     ],
-) -> float:
-    """Read value from ADC pin."""
-    filename = {
-        "P9_39": "in_voltage0_raw",
-        "P9_40": "in_voltage1_raw",
-        "P9_37": "in_voltage2_raw",
-        "P9_38": "in_voltage3_raw",
-        "P9_33": "in_voltage4_raw",
-        "P9_36": "in_voltage5_raw",
-        "P9_35": "in_voltage6_raw",
-    }.get(pin)
+) -> int | None:
+    """Open sysfs file of ADC pin once and return its file descriptor."""
+    filename = _PIN_TO_FILE.get(pin)
 
     if filename is None:
         _LOGGER.error("ADC pin %s is not valid.", pin)
-        return 0.0
+        return None
+
+    try:
+        return os.open(f"{ADC_PATH}/{filename}", os.O_RDONLY)
+    except OSError as ex:
+        _LOGGER.error("Error opening ADC pin %s: %s", pin, ex)
+        return None
+
 
-    path = Path("/sys/bus/iio/devices/iio:device0/" / filename)
+def read(fd: int, pin: str) -> float:
+    """Read value from ADC pin through its open file descriptor."""
     try:
-        with path.open() as file:
-            value = int(file.read().strip())
-            return round((value / MAX_ADC_VALUE) * REFERENCE_VOLTAGE, 3)
+        # sysfs regenerates the attribute on every read from offset 0.
+        value = int(os.pread(fd, 8, 0))
+        return round((value / MAX_ADC_VALUE) * REFERENCE_VOLTAGE, 3)
     except Exception as ex:
         _LOGGER.error("Error reading ADC pin %s: %s", pin, ex)
         return 0.0
@@ -55,12 +70,19 @@ def read(
 class GpioADCSensor(BasicMqtt, AsyncUpdater, Filter):
     """Represent Gpio ADC sensor."""
 
+    __slots__ = (
+        "_pin",
+        "_fd",
+        "_state",
+    )
+
     def __init__(self, pin: str, filters: list, **kwargs) -> None:
         """Setup GPIO ADC Sensor"""
         super().__init__(topic_type=SENSOR, **kwargs)
         self._pin = pin
+        self._fd = open_adc(pin)
         self._state = None
-        self._filters = filters
+        self.set_filters(filters)
         AsyncUpdater.__init__(self, **kwargs)
         _LOGGER.debug("Configured sensor pin %s", self._pin)
 
@@ -69,9 +91,21 @@ class GpioADCSensor(BasicMqtt, AsyncUpdater, Filter):
         """Give rounded value of temperature."""
         return self._state
 
+    def close(self) -> None:
+        """Close sysfs file of the ADC pin."""
+        fd = getattr(self, "_fd", None)
+        if fd is not None:
+            self._fd = None
+            os.close(fd)
+
+    def __del__(self) -> None:
+        self.close()
+
     def update(self, timestamp: float) -> None:
         """Fetch temperature periodically and send to MQTT."""
-        _state = self._apply_filters(value=read(self._pin))
+        if self._fd is None:
+            return
+        _state = self._apply_filters(value=read(self._fd, self._pin))
         if not _state:
             return
         self._state = _state
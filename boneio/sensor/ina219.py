@@ -7,10 +7,11 @@ import logging
 import time
 from datetime import datetime
 
-from boneio.const import SENSOR, STATE
+from boneio.const import SENSOR
 from boneio.helper import AsyncUpdater, BasicMqtt
 from boneio.helper.filter import Filter
 from boneio.helper.sensor.ina_219_smbus import INA219_I2C
+from boneio.helper.util import state_payload
 from boneio.models import SensorState
 
 _LOGGER = logging.getLogger(__name__)
@@ -21,15 +22,28 @@ unit_converter = {"current": "A", "power": "W", "voltage": "V"}
 class INA219Sensor(BasicMqtt, Filter):
     """Represent single value from INA219 as sensor."""
 
+    __slots__ = (
+        "_unit_of_measurement",
+        "_device_class",
+        "_raw_state",
+        "_timestamp",
+        "_state",
+    )
+
     def __init__(
-        self, device_class: str, filters: list, state: float | None, **kwargs
+        self,
+        device_class: str,
+        filters: list,
+        state: float | None,
+        now: float | None = None,
+        **kwargs,
     ) -> None:
         super().__init__(topic_type=SENSOR, **kwargs)
         self._unit_of_measurement = unit_converter[device_class]
         self._device_class = device_class
-        self._filters = filters
+        self.set_filters(filters)
         self._raw_state = state
-        self._timestamp = time.time()
+        self._timestamp = now if now is not None else time.time()
         self._state = (
             self._apply_filters(value=self._raw_state) if self._raw_state else None
         )
@@ -58,17 +72,19 @@ class INA219Sensor(BasicMqtt, Filter):
     def last_timestamp(self) -> float:
         return self._timestamp
 
-    def update(self, timestamp: float) -> None:
-        """Fetch sensor data periodically and send to MQTT."""
-        _state = self._apply_filters(value=self._raw_state) if self._raw_state else None
-        if not _state:
-            return
-        self._state = _state
+    @property
+    def send_topic(self) -> str:
+        return self._send_topic
+
+    def update(self, timestamp: float, value: float) -> bool:
+        """Store and filter a new raw reading. Return True if state changed."""
+        self._raw_state = value
+        state = self._apply_filters(value=value)
+        if state is None or state == self._state:
+            return False
+        self._state = state
         self._timestamp = timestamp
-        self._message_bus.send_message(
-            topic=self._send_topic,
-            payload={STATE: self.state},
-        )
+        return True
 
 
 class INA219(AsyncUpdater):
@@ -80,8 +96,10 @@ class INA219(AsyncUpdater):
         """Setup INA219 Sensor"""
         self._loop = asyncio.get_event_loop()
         self._ina_219 = INA219_I2C(address=address)
+        self._message_bus = kwargs["message_bus"]
         self._sensors = {}
         self._id = id
+        now = time.time()
         for sensor in sensors:
             _name = sensor["id"]
             _id = f"{id}{_name.replace(' ', '')}"
@@ -89,10 +107,13 @@ class INA219(AsyncUpdater):
                 device_class=sensor["device_class"],
                 filters=sensor.get("filters", []),
                 state=None,
+                now=now,
                 name=_name,
                 id=_id,
                 **kwargs,
             )
+        self._readers = list(self._sensors.items())
+        self._device_classes = frozenset(self._sensors)
         AsyncUpdater.__init__(self, **kwargs)
         _LOGGER.debug("Configured INA219 on address %s", address)
 
@@ -104,22 +125,42 @@ class INA219(AsyncUpdater):
     def sensors(self) -> dict:
         return self._sensors
 
+    def _read_values(self) -> list[float]:
+        """Read all configured values from the chip. Runs in executor."""
+        values = self._ina_219.read_all(self._device_classes)
+        return [values[device_class] for device_class, _ in self._readers]
+
     async def async_update(self, timestamp: datetime) -> None:
-        """Fetch temperature periodically and send to MQTT."""
-        for k, sensor in self._sensors.items():
-            value = getattr(self._ina_219, k)
+        """Fetch values periodically and send changed ones to MQTT in one batch."""
+        updated = []
+        # A poll is several SMBus transactions; keep them off the event loop.
+        values = await self._loop.run_in_executor(None, self._read_values)
+        for (k, sensor), value in zip(self._readers, values):
             _LOGGER.debug("Fetched INA219 value: %s %s", k, value)
-            if sensor.raw_state != value:
-                sensor.raw_state = value
-                sensor.update(timestamp=timestamp)
-                self.manager.event_bus.trigger_event({
-                    "event_type": "sensor",
-                    "entity_id": sensor.id,
-                    "event_state": SensorState(
-                        id=sensor.id,
-                        name=sensor.name,
-                        state=sensor.state,
-                        unit=sensor.unit_of_measurement,
-                        timestamp=sensor.last_timestamp,
-                    ),
-                })
+            # Filter only values that actually changed since the last poll.
+            if sensor.raw_state != value and sensor.update(
+                timestamp=timestamp, value=value
+            ):
+                updated.append(sensor)
+        if not updated:
+            return
+        # Unchanged states aren't resent, so retain them for HA restarts.
+        self._message_bus.send_messages(
+            [(sensor.send_topic, state_payload(sensor.state)) for sensor in updated],
+            retain=True,
+        )
+        self.manager.event_bus.trigger_events(
+            {
+                "event_type": "sensor",
+                "entity_id": sensor.id,
+                # Fields come straight from the sensor, so skip pydantic validation.
+                "event_state": SensorState.model_construct(
+                    id=sensor.id,
+                    name=sensor.name,
+                    state=sensor.state,
+                    unit=sensor.unit_of_measurement,
+                    timestamp=sensor.last_timestamp,
+                ),
+            }
+            for sensor in updated
+        )
@@ -12,6 +12,8 @@ _LOGGER = logging.getLogger(__name__)
 class SerialNumberSensor(BasicMqtt, AsyncUpdater):
     """Represent Serial Number sensor."""
 
+    __slots__ = ("_state",)
+
     def __init__(self, **kwargs) -> None:
         """Setup GPIO ADC Sensor"""
         super().__init__(topic_type=SENSOR, **kwargs)
@@ -26,12 +28,14 @@ class SerialNumberSensor(BasicMqtt, AsyncUpdater):
 
     async def async_update(self, timestamp: float) -> None:
         """Fetch temperature periodically and send to MQTT."""
-        network_info = get_network_info()
-        if not network_info or "mac" not in network_info:
-            return
-        # Remove colons and take last 6 characters
-        _state = network_info["mac"].replace(':', '')[-6:]
-        self._state = f"blk{_state}"
+        if self._state is None:
+            # The MAC doesn't change while running, so look it up only once.
+            network_info = get_network_info()
+            if not network_info or "mac" not in network_info:
+                return
+            # Remove colons and take last 6 characters
+            _state = network_info["mac"].replace(':', '')[-6:]
+            self._state = f"blk{_state}"
         self._timestamp = timestamp
         self._message_bus.send_message(
             topic=self._send_topic,
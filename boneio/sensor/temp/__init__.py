@@ -2,21 +2,26 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 
-from boneio.const import SENSOR, STATE, TEMPERATURE
+from boneio.const import SENSOR, TEMPERATURE
 from boneio.helper import AsyncUpdater, BasicMqtt
 from boneio.helper.exceptions import I2CError
 from boneio.helper.filter import Filter
+from boneio.helper.util import state_payload
 from boneio.models import SensorState
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared by every sensor created without filters; never mutated.
+DEFAULT_FILTERS = [{"round": 2}]
+
 
 class TempSensor(BasicMqtt, AsyncUpdater, Filter):
     """Represent Temp sensor in BoneIO."""
 
+    __slots__ = ("_unit_of_measurement", "_state", "_pct")
+
     SensorClass = None
     DefaultName = TEMPERATURE
 
@@ -25,13 +30,11 @@ class TempSensor(BasicMqtt, AsyncUpdater, Filter):
         i2c,
         address: str,
         id: str = DefaultName,
-        filters: list = ["round(x, 2)"],
+        filters: list = DEFAULT_FILTERS,
         unit_of_measurement: str = "°C",
         **kwargs,
     ):
         """Initialize Temp class."""
-        self._loop = asyncio.get_event_loop()
-        
         # Debug log the kwargs
         _LOGGER.debug("TempSensor initialization kwargs: %s", kwargs)
         
@@ -46,10 +49,7 @@ class TempSensor(BasicMqtt, AsyncUpdater, Filter):
         # Initialize AsyncUpdater next
         AsyncUpdater.__init__(self, manager=manager, update_interval=update_interval)
         
-        # Initialize Filter
-        Filter.__init__(self)
-        
-        self._filters = filters
+        self.set_filters(filters)
         self._unit_of_measurement = unit_of_measurement
         self._state: float | None = None
         try:
@@ -67,23 +67,28 @@ class TempSensor(BasicMqtt, AsyncUpdater, Filter):
     def unit_of_measurement(self) -> str:
         return self._unit_of_measurement
 
+    async def async_read(self) -> float:
+        """Read temperature from the chip."""
+        return self._pct.temperature
+
     async def async_update(self, timestamp: float) -> None:
         """Fetch temperature periodically and send to MQTT."""
         try:
-            _temp = self._pct.temperature
+            _temp = await self.async_read()
             _LOGGER.debug("Fetched temperature %s. Applying filters.", _temp)
-            _temp = self._apply_filters(value=self._pct.temperature)
-        except RuntimeError as err:
+            _temp = self._apply_filters(value=_temp)
+        except (RuntimeError, OSError) as err:
             _temp = None
             _LOGGER.error("Sensor error: %s %s", err, self.id)
-        if _temp is None:
+        if _temp is None or _temp == self._state:
             return
         self._state = _temp
         self._timestamp = timestamp
         self.manager.event_bus.trigger_event({
             "event_type": "sensor",
             "entity_id": self.id,
-            "event_state": SensorState(
+            # Fields come straight from the sensor, so skip pydantic validation.
+            "event_state": SensorState.model_construct(
                 id=self.id,
                 name=self.name,
                 state=self.state,
@@ -91,7 +96,9 @@ class TempSensor(BasicMqtt, AsyncUpdater, Filter):
                 timestamp=self.last_timestamp,
             ),
         })
+        # Unchanged states aren't resent, so retain them for HA restarts.
         self._message_bus.send_message(
             topic=self._send_topic,
-            payload={STATE: self._state},
+            payload=state_payload(self._state),
+            retain=True,
         )
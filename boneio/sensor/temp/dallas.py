@@ -1,6 +1,5 @@
 """Dallas temp sensor."""
 
-import asyncio
 import logging
 
 from adafruit_ds18x20 import DS18X20
@@ -10,7 +9,7 @@ from w1thermsensor import (
     W1ThermSensorError,
 )
 
-from boneio.const import SENSOR, STATE, TEMPERATURE
+from boneio.const import SENSOR, TEMPERATURE
 from boneio.helper import AsyncUpdater, BasicMqtt
 from boneio.helper.exceptions import OneWireError
 from boneio.helper.onewire import (
@@ -18,13 +17,16 @@ from boneio.helper.onewire import (
     OneWireAddress,
     OneWireBus,
 )
+from boneio.helper.util import state_payload
 
-from . import TempSensor
+from . import DEFAULT_FILTERS, TempSensor
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class DallasSensorDS2482(TempSensor, AsyncUpdater):
+    __slots__ = ()
+
     DefaultName = TEMPERATURE
     SensorClass = DS18X20
 
@@ -33,11 +35,13 @@ class DallasSensorDS2482(TempSensor, AsyncUpdater):
         bus: OneWireBus,
         address: OneWireAddress,
         id: str = DefaultName,
+        filters: list = DEFAULT_FILTERS,
         **kwargs,
     ):
         """Initialize Temp class."""
-        self._loop = asyncio.get_event_loop()
         BasicMqtt.__init__(self, id=id, topic_type=SENSOR, **kwargs)
+        self.set_filters(filters)
+        self._unit_of_measurement = "°C"
         try:
             self._pct = DS18X20(bus=bus, address=address)
             self._state = None
@@ -47,6 +51,8 @@ class DallasSensorDS2482(TempSensor, AsyncUpdater):
 
 
 class DallasSensorW1(TempSensor, AsyncUpdater):
+    __slots__ = ()
+
     DefaultName = TEMPERATURE
     SensorClass = AsyncBoneIOW1ThermSensor
 
@@ -54,13 +60,13 @@ class DallasSensorW1(TempSensor, AsyncUpdater):
         self,
         address: OneWireAddress,
         id: str = DefaultName,
-        filters: list = ["round(x, 2)"],
+        filters: list = DEFAULT_FILTERS,
         **kwargs,
     ):
         """Initialize Temp class."""
-        self._loop = asyncio.get_event_loop()
         BasicMqtt.__init__(self, id=id, topic_type=SENSOR, **kwargs)
-        self._filters = filters
+        self.set_filters(filters)
+        self._unit_of_measurement = "°C"
         self._state = None
         try:
             self._pct = AsyncBoneIOW1ThermSensor(sensor_id=address)
@@ -73,13 +79,15 @@ class DallasSensorW1(TempSensor, AsyncUpdater):
             _temp = await self._pct.get_temperature()
             _LOGGER.debug("Fetched temperature %s. Applying filters.", _temp)
             _temp = self._apply_filters(value=_temp)
-            if _temp is None:
+            if _temp is None or _temp == self._state:
                 return
             self._state = _temp
             self._timestamp = timestamp
+            # Unchanged states aren't resent, so retain them for HA restarts.
             self._message_bus.send_message(
                 topic=self._send_topic,
-                payload={STATE: self._state},
+                payload=state_payload(self._state),
+                retain=True,
             )
         except SensorNotReadyError as err:
             _LOGGER.error("Sensor not ready, can't update %s", err)
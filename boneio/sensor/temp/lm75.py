@@ -9,5 +9,7 @@ from . import TempSensor
 class LM75Sensor(TempSensor):
     """Represent LM75 sensor in BoneIO."""
 
+    __slots__ = ()
+
     SensorClass = PCT2075
     DefaultName = LM75
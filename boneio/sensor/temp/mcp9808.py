@@ -10,5 +10,7 @@ from . import TempSensor
 class MCP9808Sensor(TempSensor):
     """Represent MCP9808 sensor in BoneIO."""
 
+    __slots__ = ()
+
     SensorClass = MCP9808
     DefaultName = MCP_TEMP_9808
@@ -0,0 +1,53 @@
+"""Shared fixtures for BoneIO tests."""
+
+import pytest
+
+
+class FakeI2C:
+    """In-memory I2C bus holding the register file of one device.
+
+    Registers auto-increment like an MCP23017 in IOCON.BANK=0 mode. Every
+    write transaction is logged as (register, bytes).
+    """
+
+    def __init__(self, size: int = 0x16) -> None:
+        self.registers = bytearray(size)
+        self.writes: list[tuple[int, bytes]] = []
+
+    def try_lock(self) -> bool:
+        return True
+
+    def unlock(self) -> None:
+        pass
+
+    def writeto(self, address, buffer, *, start=0, end=None) -> None:
+        data = bytes(buffer[start:end])
+        if not data:
+            return  # Device probe.
+        register, payload = data[0], data[1:]
+        self.registers[register : register + len(payload)] = payload
+        self.writes.append((register, payload))
+
+    def readfrom_into(self, address, buffer, *, start=0, end=None) -> None:
+        pass
+
+    def writeto_then_readfrom(
+        self,
+        address,
+        buffer_out,
+        buffer_in,
+        *,
+        out_start=0,
+        out_end=None,
+        in_start=0,
+        in_end=None,
+    ) -> None:
+        register = buffer_out[out_start]
+        in_end = len(buffer_in) if in_end is None else in_end
+        length = in_end - in_start
+        buffer_in[in_start:in_end] = self.registers[register : register + length]
+
+
+@pytest.fixture
+def i2c() -> FakeI2C:
+    return FakeI2C()
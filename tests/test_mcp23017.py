@@ -0,0 +1,49 @@
+"""Tests for the cached MCP23017 port word."""
+
+import asyncio
+
+from boneio.helper.mcp23017 import MCP23017
+
+_GPIOA = 0x12
+
+
+def _gpio_writes(i2c) -> list[int]:
+    return [
+        int.from_bytes(payload, "little")
+        for register, payload in i2c.writes
+        if register == _GPIOA
+    ]
+
+
+def test_write_bits_on_loop_is_staged_until_flush(i2c):
+    async def run():
+        mcp = MCP23017(i2c, address=0x20)
+        i2c.writes.clear()
+        mcp.write_bits(0b0001, 0b0001)
+        mcp.write_bits(0b0110, 0b0100)
+        # Nothing hits the bus yet, but reads already see the staged bits.
+        assert _gpio_writes(i2c) == []
+        assert mcp.gpio == 0b0101
+        await asyncio.sleep(0)
+        assert _gpio_writes(i2c) == [0b0101]
+        # A later iteration gets its own single write.
+        mcp.write_bits(0b0001, 0)
+        await asyncio.sleep(0)
+        assert _gpio_writes(i2c) == [0b0101, 0b0100]
+
+    asyncio.run(run())
+
+
+def test_write_bits_off_loop_writes_immediately(i2c):
+    async def run():
+        mcp = MCP23017(i2c, address=0x20)
+        i2c.writes.clear()
+        mcp.write_bits(0b0010, 0b0010)
+        # Another thread writes at once, carrying the bits staged on the loop.
+        await asyncio.to_thread(mcp.write_bits, 0b1000, 0b1000)
+        assert _gpio_writes(i2c) == [0b1010]
+        # The pending flush finds nothing left to write.
+        await asyncio.sleep(0)
+        assert _gpio_writes(i2c) == [0b1010]
+
+    asyncio.run(run())
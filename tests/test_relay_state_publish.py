@@ -0,0 +1,87 @@
+"""Tests for batched relay state publishing."""
+
+import asyncio
+import json
+from unittest import mock
+
+from boneio.const import OFF, ON
+from boneio.helper.mcp23017 import MCP23017
+from boneio.relay.mcp import MCPRelay
+
+_GPIOA = 0x12
+
+
+def _make_relay(i2c, message_bus, pin: int = 3) -> MCPRelay:
+    return MCPRelay(
+        pin=pin,
+        mcp=MCP23017(i2c, address=0x20),
+        mcp_id="mcp1",
+        id=f"relay{pin}",
+        event_bus=mock.MagicMock(),
+        topic_prefix="boneio",
+        message_bus=message_bus,
+    )
+
+
+def _published_states(message_bus) -> list[str]:
+    return [
+        json.loads(call.kwargs["payload"])["state"]
+        for call in message_bus.send_message.call_args_list
+    ]
+
+
+def test_burst_publishes_last_state_once(i2c):
+    async def run():
+        message_bus = mock.MagicMock()
+        relay = _make_relay(i2c, message_bus)
+        relay.turn_on()
+        relay.send_state()
+        relay.turn_off()
+        relay.send_state()
+        assert relay.state == OFF
+        # Publishing waits for the next loop iteration.
+        message_bus.send_message.assert_not_called()
+        await asyncio.sleep(0)
+        assert _published_states(message_bus) == [OFF]
+        assert message_bus.send_message.call_args.kwargs["retain"] is True
+
+    asyncio.run(run())
+
+
+def test_repeated_state_is_published_again(i2c):
+    async def run():
+        message_bus = mock.MagicMock()
+        relay = _make_relay(i2c, message_bus)
+        for _ in range(2):
+            relay.turn_on()
+            relay.send_state()
+            await asyncio.sleep(0)
+        assert _published_states(message_bus) == [ON, ON]
+
+    asyncio.run(run())
+
+
+def test_port_is_written_before_state_is_published(i2c):
+    async def run():
+        order = []
+        message_bus = mock.MagicMock()
+        message_bus.send_message.side_effect = lambda **kwargs: order.append(
+            "publish"
+        )
+        relay = _make_relay(i2c, message_bus)
+        i2c.writes.clear()
+        writeto = i2c.writeto
+
+        def log_write(address, buffer, **kwargs):
+            if buffer[0] == _GPIOA:
+                order.append("port")
+            writeto(address, buffer, **kwargs)
+
+        i2c.writeto = log_write
+        relay.turn_on()
+        relay.send_state()
+        await asyncio.sleep(0)
+        assert order == ["port", "publish"]
+        assert relay.is_active
+
+    asyncio.run(run())
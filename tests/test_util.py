@@ -0,0 +1,19 @@
+"""Tests for boneio.helper.util."""
+
+import json
+import math
+
+import pytest
+
+from boneio.helper.util import state_payload
+
+
+@pytest.mark.parametrize("state", [0.0, 21.5, -3.25, 1e-7, 12345678.9, 3])
+def test_state_payload_matches_json_dumps(state):
+    assert state_payload(state) == json.dumps({"state": state})
+
+
+@pytest.mark.parametrize("state", [math.nan, math.inf, -math.inf])
+def test_state_payload_non_finite_is_null(state):
+    payload = state_payload(state)
+    assert json.loads(payload) == {"state": None}